@@ -1,9 +1,131 @@
-"""Abstract base class for e-commerce platform clients."""
+"""Abstract base class and shared HTTP plumbing for e-commerce platform clients."""
 
+import json
 from abc import ABC, abstractmethod
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from delivery_routing.models import DeliveryAddress
 
+_ENV_LOADED = False
+
+_SHARED_SESSION = None
+
+# Connection-pool and retry tuning applied to every session we create.
+_POOL_SIZE = 32
+_RETRY_TOTAL = 5
+_RETRY_BACKOFF = 0.5
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def load_env() -> None:
+    """Load the .env file into the environment, at most once per process.
+
+    Deferred to client construction so that importing a client module
+    (or just running --help) does not pay for the dotenv import and the
+    .env filesystem walk.
+    """
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+def json_loads(data: bytes) -> dict:
+    """Decode a JSON response body.
+
+    Uses orjson when installed -- a native parser that is several times
+    faster than the stdlib on typical order-list payloads -- and falls
+    back to the stdlib json module otherwise. Takes raw bytes so no
+    separate UTF-8 decode pass is needed.
+
+    Args:
+        data: Raw JSON bytes from a response body.
+
+    Returns:
+        The decoded response dict.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: dict) -> bytes:
+    """Encode a JSON request body to bytes.
+
+    Counterpart of json_loads(): orjson when installed, stdlib json
+    otherwise. Returns bytes so the body can be handed straight to the
+    HTTP layer with no further encode.
+
+    Args:
+        obj: The request body to encode.
+
+    Returns:
+        UTF-8 JSON bytes.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def make_session() -> "requests.Session":
+    """Build a requests.Session tuned for burst API traffic.
+
+    The default HTTPAdapter keeps only 10 pooled connections and never
+    retries, so concurrent fan-outs churn TLS handshakes and a single
+    429/5xx kills the run. Mount an adapter with a larger pool and a
+    backoff Retry policy that honours Retry-After, matching Shopify's
+    leaky-bucket rate limiting. POST is included in the retryable
+    methods (urllib3 excludes it by default) because every POST in this
+    codebase is a read-only query -- the TikTok search and detail
+    endpoints -- so replaying one is safe. requests is only imported on
+    first use.
+
+    Returns:
+        A configured requests.Session.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    retry = Retry(
+        total=_RETRY_TOTAL,
+        backoff_factor=_RETRY_BACKOFF,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=None,  # retry all methods, including POST
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_POOL_SIZE,
+        pool_maxsize=_POOL_SIZE,
+        max_retries=retry,
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+def shared_session() -> "requests.Session":
+    """Return the process-wide pooled HTTP session.
+
+    Clients that authenticate purely through signed query parameters
+    share one requests.Session, so keep-alive connections are pooled
+    across client instances instead of each instance opening its own.
+
+    Returns:
+        The lazily created shared requests.Session.
+    """
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = make_session()
+        _SHARED_SESSION.headers.update({"Content-Type": "application/json"})
+    return _SHARED_SESSION
+
 
 class EcommercePlatformClient(ABC):
     """Base class that all e-commerce platform clients must implement."""
@@ -36,12 +36,16 @@ def _export_csv(addresses, path):
             "city", "province", "zip", "country",
             "phone", "latitude", "longitude",
         ])
-        for i, addr in enumerate(addresses, 1):
-            writer.writerow([
+        # One writerows call keeps the row loop inside the csv module
+        # instead of one Python-level writerow call per stop.
+        writer.writerows(
+            (
                 i, addr.order_name, addr.name, addr.full_address,
                 addr.city, addr.province, addr.zip_code, addr.country,
                 addr.phone, addr.latitude or "", addr.longitude or "",
-            ])
+            )
+            for i, addr in enumerate(addresses, 1)
+        )
     print(f"Route exported to {path}")
 
 
@@ -1,12 +1,22 @@
 """Shared data models for delivery routing across e-commerce platforms."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DeliveryAddress:
-    """A delivery address extracted from an e-commerce order."""
+    """A delivery address extracted from an e-commerce order.
 
+    Slotted to keep per-instance overhead down: bulk extractions create
+    one of these per order, and slots drop the instance __dict__ while
+    making attribute access a fixed-offset load. Frozen because nothing
+    mutates an address after extraction, which also makes instances
+    hashable for use as dict/set keys in deduplication.
+    """
+
+    # Deliberately str, not int: Shopify order IDs are numeric, but
+    # Shopee order_sn and TikTok order IDs are arbitrary strings, so a
+    # numeric type would not hold across platforms.
     order_id: str
     order_name: str
     name: str
@@ -19,11 +29,18 @@ class DeliveryAddress:
     phone: str
     latitude: float | None = None
     longitude: float | None = None
+    # Joined once at construction: both the route printout and the CSV
+    # export read it, and slots=True rules out functools.cached_property.
+    full_address: str = field(init=False, repr=False)
 
-    @property
-    def full_address(self) -> str:
+    def __post_init__(self):
         parts = [self.address1]
         if self.address2:
             parts.append(self.address2)
         parts.extend([self.city, self.province, self.zip_code, self.country])
-        return ", ".join(p for p in parts if p)
+        # frozen=True blocks normal assignment; this is the standard
+        # dataclass idiom for filling derived fields.
+        # List comprehension rather than a generator: str.join over a
+        # list sizes the result in one pass instead of materializing the
+        # generator first.
+        object.__setattr__(self, "full_address", ", ".join([p for p in parts if p]))
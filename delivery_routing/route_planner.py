@@ -2,11 +2,41 @@
 
 from math import atan2, cos, radians, sin, sqrt
 
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def wrap(func):
+            return func
+        return wrap
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
 from delivery_routing.models import DeliveryAddress
 
 # Approximate radius of Earth in kilometres.
 _EARTH_RADIUS_KM = 6371.0
 
+# Minimum number of stops before the matrix-free paths pay for
+# themselves; below this the distance-matrix scan is faster and the
+# matrix stays small.
+_MATRIX_FREE_MIN_STOPS = 512
+
+# Largest route the interpreted 2-opt loop may improve. Without numba
+# the best-improvement pass is effectively O(n^3) Python bytecode and
+# takes seconds beyond ~100 stops; with numba it is compiled and cheap
+# for every matrix-sized route.
+_TWO_OPT_MAX_INTERPRETED_STOPS = 100
+
 
 def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Return the great-circle distance in km between two lat/lon points."""
@@ -19,21 +49,230 @@ def haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
 
 def _build_distance_matrix(
     addresses: list[DeliveryAddress],
-) -> list[list[float]]:
-    """Build a symmetric distance matrix between all addresses."""
-    n = len(addresses)
-    matrix: list[list[float]] = [[0.0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(i + 1, n):
-            d = haversine(
-                addresses[i].latitude or 0.0,
-                addresses[i].longitude or 0.0,
-                addresses[j].latitude or 0.0,
-                addresses[j].longitude or 0.0,
-            )
-            matrix[i][j] = d
-            matrix[j][i] = d
-    return matrix
+) -> np.ndarray:
+    """Build a symmetric n x n distance matrix between all addresses.
+
+    The haversine formula is applied to whole coordinate arrays at once
+    via NumPy broadcasting instead of one pair at a time in Python.
+    Per-point terms (radians conversion, cos(lat)) are computed once and
+    reused across all n-1 pairings, and the identity
+    sin^2(x/2) = (1 - cos(x)) / 2 trims the per-pair trig down to two
+    cosines. Equivalent to sklearn.metrics.pairwise.haversine_distances
+    scaled by the Earth radius, without the scikit-learn dependency.
+
+    Args:
+        addresses: List of delivery addresses with lat/lon coordinates.
+
+    Returns:
+        An (n, n) float32 ndarray of pairwise distances in km. Single
+        precision costs well under 1 m of accuracy at delivery scale but
+        quarters the matrix footprint versus float64, keeping the
+        nearest-neighbour scan cache-resident for longer.
+    """
+    lat = np.radians(
+        np.array([a.latitude or 0.0 for a in addresses], dtype=np.float64)
+    )
+    lon = np.radians(
+        np.array([a.longitude or 0.0 for a in addresses], dtype=np.float64)
+    )
+    cos_lat = np.cos(lat)
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    a = (1 - np.cos(dlat)) / 2 + (
+        cos_lat[:, None] * cos_lat[None, :] * (1 - np.cos(dlon)) / 2
+    )
+    # Rounding can push a marginally outside [0, 1]; clamp before sqrt.
+    a = np.clip(a, 0.0, 1.0)
+    matrix = 2 * _EARTH_RADIUS_KM * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+    return matrix.astype(np.float32)
+
+
+def _project_xy(addresses: list[DeliveryAddress]) -> np.ndarray:
+    """Project lat/lon onto a local flat plane in kilometres.
+
+    Uses an equirectangular projection around the mean coordinate; the
+    error versus great-circle distance is well under 0.5% at city scale,
+    which is fine for choosing the nearest stop.
+
+    Args:
+        addresses: List of delivery addresses with lat/lon coordinates.
+
+    Returns:
+        An (n, 2) float64 array of x/y positions in km.
+    """
+    lat = np.radians(
+        np.array([a.latitude or 0.0 for a in addresses], dtype=np.float64)
+    )
+    lon = np.radians(
+        np.array([a.longitude or 0.0 for a in addresses], dtype=np.float64)
+    )
+    lat0 = lat.mean()
+    lon0 = lon.mean()
+    x = _EARTH_RADIUS_KM * np.cos(lat0) * (lon - lon0)
+    y = _EARTH_RADIUS_KM * (lat - lat0)
+    return np.column_stack((x, y))
+
+
+def _nn_route_kdtree(xy: np.ndarray, start: int) -> np.ndarray:
+    """Nearest-neighbour scan using a KD-tree over projected coordinates.
+
+    Avoids building the O(n^2) distance matrix entirely: each step
+    queries the tree for the closest points and skips ones already
+    visited, doubling k until an unvisited hit is found.
+
+    Args:
+        xy: (n, 2) array of projected x/y positions in km.
+        start: Index of the starting point.
+
+    Returns:
+        An (n,) int64 array of indices in visiting order.
+    """
+    n = xy.shape[0]
+    tree = cKDTree(xy)
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int64)
+    order[0] = start
+    visited[start] = True
+    current = start
+    for step in range(1, n):
+        k = 2
+        best_idx = -1
+        while best_idx < 0:
+            k = min(k * 2, n)
+            _, neighbours = tree.query(xy[current], k=k)
+            for j in np.atleast_1d(neighbours):
+                if not visited[j]:
+                    best_idx = int(j)
+                    break
+            if k == n:
+                break
+        visited[best_idx] = True
+        order[step] = best_idx
+        current = best_idx
+    return order
+
+
+@njit(cache=True)
+def _nn_route_xy(xy: np.ndarray, start: int) -> np.ndarray:
+    """Nearest-neighbour scan over projected coordinates, matrix-free.
+
+    Compares squared planar distances, which preserves the argmin while
+    keeping the hot loop to multiplies and adds -- no trig, no sqrt, and
+    no O(n^2) matrix. Used for large routes when scipy's KD-tree is not
+    available.
+
+    Args:
+        xy: (n, 2) array of projected x/y positions in km.
+        start: Index of the starting point.
+
+    Returns:
+        An (n,) int64 array of indices in visiting order.
+    """
+    n = xy.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int64)
+    order[0] = start
+    visited[start] = True
+    current = start
+    for step in range(1, n):
+        cx = xy[current, 0]
+        cy = xy[current, 1]
+        best_d2 = np.inf
+        best_idx = -1
+        for j in range(n):
+            if not visited[j]:
+                dx = xy[j, 0] - cx
+                dy = xy[j, 1] - cy
+                d2 = dx * dx + dy * dy
+                if d2 < best_d2:
+                    best_d2 = d2
+                    best_idx = j
+        visited[best_idx] = True
+        order[step] = best_idx
+        current = best_idx
+    return order
+
+
+@njit(cache=True)
+def _nn_route_indices(matrix: np.ndarray, start: int) -> np.ndarray:
+    """Run the nearest-neighbour scan over a precomputed distance matrix.
+
+    Compiled to native code when numba is installed; otherwise runs as
+    plain Python over the NumPy matrix.
+
+    Args:
+        matrix: (n, n) pairwise distance matrix.
+        start: Index of the starting point.
+
+    Returns:
+        An (n,) int64 array of indices in visiting order.
+    """
+    n = matrix.shape[0]
+    visited = np.zeros(n, dtype=np.bool_)
+    order = np.empty(n, dtype=np.int64)
+    order[0] = start
+    visited[start] = True
+    current = start
+    for step in range(1, n):
+        # Mask out visited stops and take one vectorized argmin over the
+        # current row instead of an element-wise Python comparison loop.
+        row = np.where(visited, np.inf, matrix[current])
+        best_idx = row.argmin()
+        visited[best_idx] = True
+        order[step] = best_idx
+        current = best_idx
+    return order
+
+
+@njit(cache=True)
+def _two_opt(matrix: np.ndarray, order: np.ndarray) -> np.ndarray:
+    """Improve a route in place with repeated 2-opt passes.
+
+    Each pass scans all (i, j) segment pairs, computes the length delta
+    of reversing order[i..j], applies the best improving reversal, and
+    repeats until no swap shortens the route. Nearest-neighbour output
+    is typically cut by 10-20%.
+
+    Args:
+        matrix: (n, n) pairwise distance matrix.
+        order: Route indices from the nearest-neighbour scan.
+
+    Returns:
+        The improved route indices (same array, modified in place).
+    """
+    n = order.shape[0]
+    # Require a meaningful gain (in km) per swap so float32 rounding
+    # noise cannot keep the loop alive.
+    min_gain = -1e-4
+    improved = True
+    while improved:
+        improved = False
+        best_delta = min_gain
+        best_i = -1
+        best_j = -1
+        for i in range(1, n - 1):
+            for j in range(i, n - 1):
+                delta = (
+                    matrix[order[i - 1], order[j]]
+                    + matrix[order[i], order[j + 1]]
+                    - matrix[order[i - 1], order[i]]
+                    - matrix[order[j], order[j + 1]]
+                )
+                if delta < best_delta:
+                    best_delta = delta
+                    best_i = i
+                    best_j = j
+        if best_i >= 0:
+            lo = best_i
+            hi = best_j
+            while lo < hi:
+                tmp = order[lo]
+                order[lo] = order[hi]
+                order[hi] = tmp
+                lo += 1
+                hi -= 1
+            improved = True
+    return order
 
 
 def nearest_neighbour_route(
@@ -44,6 +283,11 @@ def nearest_neighbour_route(
 
     Starting from ``start_index``, the algorithm repeatedly visits the
     closest unvisited address until all addresses have been included.
+    For routes small enough to use the distance matrix, a 2-opt
+    improvement pass then untangles crossings left by the greedy scan;
+    when numba is not installed the pass is skipped beyond
+    ``_TWO_OPT_MAX_INTERPRETED_STOPS`` stops, where the interpreted
+    loop would cost far more than the greedy scan itself.
 
     Args:
         addresses: List of delivery addresses with lat/lon coordinates.
@@ -59,22 +303,19 @@ def nearest_neighbour_route(
     if start_index < 0 or start_index >= n:
         raise ValueError(f"start_index {start_index} out of range [0, {n})")
 
-    matrix = _build_distance_matrix(addresses)
-    visited = [False] * n
-    route_indices: list[int] = [start_index]
-    visited[start_index] = True
-
-    for _ in range(n - 1):
-        current = route_indices[-1]
-        best_dist = float("inf")
-        best_idx = -1
-        for j in range(n):
-            if not visited[j] and matrix[current][j] < best_dist:
-                best_dist = matrix[current][j]
-                best_idx = j
-        visited[best_idx] = True
-        route_indices.append(best_idx)
-
+    if n >= _MATRIX_FREE_MIN_STOPS:
+        xy = _project_xy(addresses)
+        if cKDTree is not None:
+            route_indices = _nn_route_kdtree(xy, start_index)
+        else:
+            route_indices = _nn_route_xy(xy, start_index)
+    else:
+        matrix = _build_distance_matrix(addresses)
+        route_indices = _nn_route_indices(matrix, start_index)
+        # Without numba the 2-opt loop runs as plain Python and its
+        # cost grows cubically, so only small routes get the pass.
+        if _HAVE_NUMBA or n <= _TWO_OPT_MAX_INTERPRETED_STOPS:
+            route_indices = _two_opt(matrix, route_indices)
     return [addresses[i] for i in route_indices]
 
 
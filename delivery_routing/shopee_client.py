@@ -1,18 +1,17 @@
 """Shopee Open Platform API client for extracting order and address information."""
 
-import hashlib
 import hmac
 import os
 import time
 
-import requests
-from dotenv import load_dotenv
-
-from delivery_routing.base_client import EcommercePlatformClient
+from delivery_routing.base_client import (
+    EcommercePlatformClient,
+    json_loads,
+    load_env,
+    shared_session,
+)
 from delivery_routing.models import DeliveryAddress
 
-load_dotenv()
-
 BASE_URL = "https://partner.shopeemobile.com/api/v2"
 
 # Mapping from generic status names to Shopee order statuses.
@@ -24,29 +23,6 @@ _STATUS_MAP = {
 }
 
 
-def _sign(partner_id: int, partner_key: str, path: str,
-          timestamp: int, access_token: str, shop_id: int) -> str:
-    """Generate HMAC-SHA256 signature for Shopee API v2.
-
-    Args:
-        partner_id: Shopee partner ID.
-        partner_key: Shopee partner key (secret).
-        path: API endpoint path (e.g. /api/v2/order/get_order_list).
-        timestamp: Unix timestamp in seconds.
-        access_token: OAuth access token.
-        shop_id: Shopee shop ID.
-
-    Returns:
-        Hex-encoded HMAC-SHA256 signature string.
-    """
-    base_string = f"{partner_id}{path}{timestamp}{access_token}{shop_id}"
-    return hmac.new(
-        partner_key.encode("utf-8"),
-        base_string.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-
-
 class ShopeeClient(EcommercePlatformClient):
     """Client for the Shopee Open Platform API v2."""
 
@@ -57,6 +33,7 @@ class ShopeeClient(EcommercePlatformClient):
         shop_id: str | None = None,
         access_token: str | None = None,
     ):
+        load_env()
         self.partner_id = int(partner_id or os.getenv("SHOPEE_PARTNER_ID", "0"))
         self.partner_key = partner_key or os.getenv("SHOPEE_PARTNER_KEY", "")
         self.shop_id = int(shop_id or os.getenv("SHOPEE_SHOP_ID", "0"))
@@ -68,8 +45,30 @@ class ShopeeClient(EcommercePlatformClient):
                 "SHOPEE_ACCESS_TOKEN must be set either as arguments or in a .env file."
             )
 
-        self.session = requests.Session()
-        self.session.headers.update({"Content-Type": "application/json"})
+        self.session = shared_session()
+
+        # The HMAC key schedule (inner/outer pad derivation) only depends
+        # on the partner key, so derive it once and .copy() per request.
+        self._hmac_template = hmac.new(
+            self.partner_key.encode("utf-8"), digestmod="sha256"
+        )
+
+    def _sign(self, path: str, timestamp: int) -> str:
+        """Generate HMAC-SHA256 signature for Shopee API v2.
+
+        Args:
+            path: API endpoint path (e.g. /api/v2/order/get_order_list).
+            timestamp: Unix timestamp in seconds.
+
+        Returns:
+            Hex-encoded HMAC-SHA256 signature string.
+        """
+        base_string = (
+            f"{self.partner_id}{path}{timestamp}{self.access_token}{self.shop_id}"
+        )
+        h = self._hmac_template.copy()
+        h.update(base_string.encode("utf-8"))
+        return h.hexdigest()
 
     def _get(self, path: str, params: dict | None = None) -> dict:
         """Make a signed GET request to the Shopee API.
@@ -82,10 +81,7 @@ class ShopeeClient(EcommercePlatformClient):
             Parsed JSON response dict.
         """
         timestamp = int(time.time())
-        sign = _sign(
-            self.partner_id, self.partner_key, path,
-            timestamp, self.access_token, self.shop_id,
-        )
+        sign = self._sign(path, timestamp)
 
         query: dict = {
             "partner_id": self.partner_id,
@@ -99,7 +95,7 @@ class ShopeeClient(EcommercePlatformClient):
 
         resp = self.session.get(f"{BASE_URL}{path}", params=query)
         resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_orders(
         self,
@@ -138,7 +134,7 @@ class ShopeeClient(EcommercePlatformClient):
             return []
 
         # Fetch full order details (including addresses) in a single batch.
-        order_sn_list = ",".join(o["order_sn"] for o in order_list)
+        order_sn_list = ",".join([o["order_sn"] for o in order_list])
         detail_params: dict = {
             "order_sn_list": order_sn_list,
             "response_optional_fields": (
@@ -162,28 +158,24 @@ class ShopeeClient(EcommercePlatformClient):
             recipient address.
         """
         orders = self.get_orders(status=status)
-        addresses: list[DeliveryAddress] = []
-
-        for order in orders:
-            recipient = order.get("recipient_address")
-            if not recipient:
-                continue
-
-            addresses.append(
-                DeliveryAddress(
-                    order_id=order.get("order_sn", ""),
-                    order_name=order.get("order_sn", ""),
-                    name=recipient.get("name", ""),
-                    address1=recipient.get("full_address", ""),
-                    address2=recipient.get("district", ""),
-                    city=recipient.get("city", ""),
-                    province=recipient.get("state", ""),
-                    country=recipient.get("region", ""),
-                    zip_code=recipient.get("zipcode", ""),
-                    phone=recipient.get("phone", ""),
-                    latitude=None,
-                    longitude=None,
-                )
+        # Local binding plus a single comprehension keeps the per-order
+        # bytecode down to dict lookups and one constructor call.
+        DA = DeliveryAddress
+        return [
+            DA(
+                order_id=order.get("order_sn", ""),
+                order_name=order.get("order_sn", ""),
+                name=recipient.get("name", ""),
+                address1=recipient.get("full_address", ""),
+                address2=recipient.get("district", ""),
+                city=recipient.get("city", ""),
+                province=recipient.get("state", ""),
+                country=recipient.get("region", ""),
+                zip_code=recipient.get("zipcode", ""),
+                phone=recipient.get("phone", ""),
+                latitude=None,
+                longitude=None,
             )
-
-        return addresses
+            for order in orders
+            if (recipient := order.get("recipient_address"))
+        ]
@@ -1,20 +1,29 @@
 """TikTok Shop API client for extracting order and address information."""
 
-import hashlib
 import hmac
 import os
 import time
-
-import requests
-from dotenv import load_dotenv
-
-from delivery_routing.base_client import EcommercePlatformClient
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+
+from delivery_routing.base_client import (
+    EcommercePlatformClient,
+    json_dumps,
+    json_loads,
+    load_env,
+    make_session,
+)
 from delivery_routing.models import DeliveryAddress
 
-load_dotenv()
-
 BASE_URL = "https://open-api.tiktokglobalshop.com"
 
+# TikTok's order detail endpoint caps order_id_list at 50 IDs per call.
+_DETAIL_CHUNK_SIZE = 50
+
+# Concurrent request cap for the detail-query fan-out. Must stay below
+# the session pool size so connections are not churned.
+_MAX_FANOUT_WORKERS = 8
+
 # Mapping from generic status names to TikTok Shop order statuses.
 _STATUS_MAP = {
     "unfulfilled": "AWAITING_SHIPMENT",
@@ -24,28 +33,6 @@ _STATUS_MAP = {
 }
 
 
-def _sign(app_secret: str, path: str, params: dict) -> str:
-    """Generate HMAC-SHA256 signature for the TikTok Shop API.
-
-    Args:
-        app_secret: TikTok Shop app secret.
-        path: API endpoint path (e.g. /api/orders/search).
-        params: All request parameters (excluding sign and access_token).
-
-    Returns:
-        Hex-encoded HMAC-SHA256 signature string.
-    """
-    sorted_params = sorted(params.items())
-    base_string = app_secret + path + "".join(
-        f"{k}{v}" for k, v in sorted_params
-    ) + app_secret
-    return hmac.new(
-        app_secret.encode("utf-8"),
-        base_string.encode("utf-8"),
-        hashlib.sha256,
-    ).hexdigest()
-
-
 class TikTokClient(EcommercePlatformClient):
     """Client for the TikTok Shop Open API."""
 
@@ -56,6 +43,7 @@ class TikTokClient(EcommercePlatformClient):
         access_token: str | None = None,
         shop_id: str | None = None,
     ):
+        load_env()
         self.app_key = app_key or os.getenv("TIKTOK_APP_KEY", "")
         self.app_secret = app_secret or os.getenv("TIKTOK_APP_SECRET", "")
         self.access_token = access_token or os.getenv("TIKTOK_ACCESS_TOKEN", "")
@@ -68,20 +56,71 @@ class TikTokClient(EcommercePlatformClient):
                 ".env file."
             )
 
-        self.session = requests.Session()
+        import requests
+
+        self.session = make_session()
         self.session.headers.update({"Content-Type": "application/json"})
 
-    def _get(self, path: str, params: dict | None = None) -> dict:
+        # Every POST shares the same method and merged headers, so run
+        # Session.prepare_request once here and .copy() the result per
+        # call; _post then only re-prepares the URL and body, skipping
+        # the header merge and cookie-jar traversal in Session.request.
+        self._post_template = self.session.prepare_request(
+            requests.Request("POST", BASE_URL)
+        )
+
+        # The HMAC key schedule (inner/outer pad derivation) only depends
+        # on the app secret, so derive it once and .copy() per request.
+        # The encoded secret is kept for base-string assembly too.
+        self._app_secret_bytes = self.app_secret.encode("utf-8")
+        self._hmac_template = hmac.new(self._app_secret_bytes, digestmod="sha256")
+
+    def _sign(self, path: str, params: dict) -> str:
+        """Generate HMAC-SHA256 signature for the TikTok Shop API.
+
+        Args:
+            path: API endpoint path (e.g. /api/orders/search).
+            params: All request parameters (excluding sign and
+                    access_token).
+
+        Returns:
+            Hex-encoded HMAC-SHA256 signature string.
+        """
+        # Assemble the base string directly as bytes: one b"".join over
+        # pre-encoded parts skips the per-parameter f-string temporaries
+        # and the final whole-string UTF-8 encode.
+        parts = [self._app_secret_bytes, path.encode("utf-8")]
+        for k, v in sorted(params.items()):
+            parts.append(k.encode("utf-8"))
+            parts.append(
+                v.encode("utf-8") if isinstance(v, str) else str(v).encode("utf-8")
+            )
+        parts.append(self._app_secret_bytes)
+        h = self._hmac_template.copy()
+        h.update(b"".join(parts))
+        return h.hexdigest()
+
+    def _get(
+        self,
+        path: str,
+        params: dict | None = None,
+        timestamp: int | None = None,
+    ) -> dict:
         """Make a signed GET request to the TikTok Shop API.
 
         Args:
             path: API endpoint path (e.g. /api/orders/search).
             params: Additional query parameters (used for signing).
+            timestamp: Unix timestamp to sign with; callers issuing a
+                       batch of requests can pass one value instead of
+                       re-reading the clock per call (TikTok accepts
+                       timestamps within a several-minute window).
 
         Returns:
             Parsed JSON response dict.
         """
-        timestamp = int(time.time())
+        if timestamp is None:
+            timestamp = int(time.time())
         sign_params: dict = {
             "app_key": self.app_key,
             "timestamp": str(timestamp),
@@ -90,7 +129,7 @@ class TikTokClient(EcommercePlatformClient):
         if params:
             sign_params.update(params)
 
-        sign = _sign(self.app_secret, path, sign_params)
+        sign = self._sign(path, sign_params)
 
         query: dict = {
             **sign_params,
@@ -100,25 +139,32 @@ class TikTokClient(EcommercePlatformClient):
 
         resp = self.session.get(f"{BASE_URL}{path}", params=query)
         resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
-    def _post(self, path: str, body: dict | None = None) -> dict:
+    def _post(
+        self,
+        path: str,
+        body: dict | None = None,
+        timestamp: int | None = None,
+    ) -> dict:
         """Make a signed POST request to the TikTok Shop API.
 
         Args:
             path: API endpoint path.
             body: JSON body payload.
+            timestamp: Unix timestamp to sign with; see _get().
 
         Returns:
             Parsed JSON response dict.
         """
-        timestamp = int(time.time())
+        if timestamp is None:
+            timestamp = int(time.time())
         sign_params: dict = {
             "app_key": self.app_key,
             "timestamp": str(timestamp),
             "shop_id": self.shop_id,
         }
-        sign = _sign(self.app_secret, path, sign_params)
+        sign = self._sign(path, sign_params)
 
         query: dict = {
             **sign_params,
@@ -126,18 +172,25 @@ class TikTokClient(EcommercePlatformClient):
             "access_token": self.access_token,
         }
 
-        resp = self.session.post(
-            f"{BASE_URL}{path}",
-            params=query,
-            json=body or {},
+        prep = self._post_template.copy()
+        prep.prepare_url(f"{BASE_URL}{path}", query)
+        prep.prepare_body(data=json_dumps(body or {}), files=None)
+        # Session.send skips merge_environment_settings (only
+        # Session.request applies it), so pass the merged proxy/TLS
+        # settings explicitly to keep HTTPS_PROXY and CA-bundle
+        # overrides working for POSTs too.
+        settings = self.session.merge_environment_settings(
+            prep.url, {}, None, None, None
         )
+        resp = self.session.send(prep, **settings)
         resp.raise_for_status()
-        return resp.json()
+        return json_loads(resp.content)
 
     def get_orders(
         self,
         status: str = "unfulfilled",
         limit: int = 100,
+        detail: bool = True,
     ) -> list[dict]:
         """Fetch orders from TikTok Shop.
 
@@ -145,12 +198,18 @@ class TikTokClient(EcommercePlatformClient):
             status: Fulfillment status filter. Accepted values:
                     "unfulfilled", "fulfilled", "partial", "any".
             limit: Max orders per request (TikTok Shop max is 100).
+            detail: When False, skip the follow-up detail query if every
+                    order in the search response already carries a
+                    recipient_address, saving a signed round trip.
+                    Callers that need line items or other detail-only
+                    fields should leave this True.
 
         Returns:
-            List of order dicts with full detail from TikTok Shop.
+            List of order dicts from TikTok Shop.
         """
-        create_time_from = int(time.time()) - 15 * 24 * 3600  # last 15 days
-        create_time_to = int(time.time())
+        now = int(time.time())
+        create_time_from = now - 15 * 24 * 3600  # last 15 days
+        create_time_to = now
 
         tiktok_status = _STATUS_MAP.get(status, "")
 
@@ -164,19 +223,40 @@ class TikTokClient(EcommercePlatformClient):
         if tiktok_status:
             body["order_status"] = tiktok_status
 
-        data = self._post("/api/orders/search", body)
+        data = self._post("/api/orders/search", body, timestamp=now)
         order_list = data.get("data", {}).get("order_list", [])
 
         if not order_list:
             return []
 
-        # Fetch full order details in a batch.
+        # Recent API versions include recipient summary fields in the
+        # search response itself; when the caller only needs addresses
+        # and every order already has one, the detail pass is redundant.
+        if not detail and all(o.get("recipient_address") for o in order_list):
+            return order_list
+
+        # Fetch full order details in chunks of 50 IDs (the endpoint's
+        # payload cap), dispatched concurrently over the pooled session.
         order_ids = [o["order_id"] for o in order_list]
-        detail_data = self._post(
-            "/api/orders/detail/query",
-            {"order_id_list": order_ids},
-        )
-        return detail_data.get("data", {}).get("order_list", [])
+        chunks = [
+            order_ids[i:i + _DETAIL_CHUNK_SIZE]
+            for i in range(0, len(order_ids), _DETAIL_CHUNK_SIZE)
+        ]
+
+        def fetch_detail(chunk: list) -> list[dict]:
+            data = self._post(
+                "/api/orders/detail/query",
+                {"order_id_list": chunk},
+                timestamp=now,
+            )
+            return data.get("data", {}).get("order_list", [])
+
+        if len(chunks) == 1:
+            return fetch_detail(chunks[0])
+
+        workers = min(_MAX_FANOUT_WORKERS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(chain.from_iterable(executor.map(fetch_detail, chunks)))
 
     def extract_delivery_addresses(
         self,
@@ -191,7 +271,7 @@ class TikTokClient(EcommercePlatformClient):
             List of DeliveryAddress objects for orders that have a
             recipient address.
         """
-        orders = self.get_orders(status=status)
+        orders = self.get_orders(status=status, detail=False)
         addresses: list[DeliveryAddress] = []
 
         for order in orders: